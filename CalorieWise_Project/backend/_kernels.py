@@ -0,0 +1,35 @@
+from typing import Tuple
+from numba import njit
+
+# round() to int64 wraps silently; results are checked against this bound
+# (far above any real intake, far below 2**63) before converting
+_MAX_CALORIES = 1e15
+
+@njit(cache=True, nogil=True)
+def core_metrics(weight_kg: float, height_cm: float, age: float,
+                 is_male: bool, multiplier: float,
+                 adjustment: float) -> Tuple[int, int, int, float]:
+    """
+    Compute BMR (Mifflin-St Jeor), TDEE, daily calories and BMI in one
+    native call. Mirrors the scalar CalorieCalculator methods term for term.
+    
+    BMR, TDEE and daily calories come back already rounded to ints, with
+    round()'s half-to-even rule; BMI is returned unrounded. Raises
+    OverflowError when a value is non-finite or out of range.
+    """
+    if is_male:
+        bmr = (10 * weight_kg) + (6.25 * height_cm) - (5 * age) + 5
+    else:
+        bmr = (10 * weight_kg) + (6.25 * height_cm) - (5 * age) - 161
+    tdee = bmr * multiplier
+    height_m = height_cm / 100
+    bmi = weight_kg / (height_m * height_m)
+    daily = tdee + adjustment
+    # Written so that NaN fails the check as well
+    if not (abs(bmr) < _MAX_CALORIES and abs(tdee) < _MAX_CALORIES
+            and abs(daily) < _MAX_CALORIES):
+        raise OverflowError('calorie values out of range')
+    return round(bmr), round(tdee), round(daily), bmi
+
+# Compile (or load from cache) at import so no request pays the JIT cost
+core_metrics(70.0, 175.0, 30.0, True, 1.2, 0.0)
@@ -1,92 +1,196 @@
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-from calculator import CalorieCalculator
-from datetime import datetime
-
-app = Flask(__name__)
-CORS(app)
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import Response
+from starlette.routing import Route
+from functools import lru_cache
+from typing import Annotated, Literal
+import msgspec
+import orjson
+from calculator import CalorieCalculator, ActivityLevel, Goal
+from time import time_ns
 
 calculator = CalorieCalculator()
 
-@app.route('/api/calculate', methods=['POST'])
-def calculate():
+# Health probes always get the same body, so encode it once
+_HEALTH_BODY = orjson.dumps({'status': 'healthy', 'version': '1.0.0'})
+
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def orjson_response(payload, status=200):
+    """Serialize payload with orjson and wrap it in a JSON response."""
+    return Response(
+        orjson.dumps(payload, option=_JSON_OPTIONS),
+        status_code=status,
+        media_type='application/json'
+    )
+
+# Upper bounds are generous but keep all downstream arithmetic in range
+Age = Annotated[int, msgspec.Meta(gt=0, le=150)]
+Weight = Annotated[float, msgspec.Meta(gt=0, le=1500)]
+Height = Annotated[float, msgspec.Meta(gt=0, le=300)]
+Calories = Annotated[float, msgspec.Meta(gt=0, le=50000)]
+Ratio = Annotated[float, msgspec.Meta(ge=0, le=1)]
+
+# Activity and goal keywords come from the calculator's enums. Heights in
+# feet are not accepted: the API has no feet/inches fields to convert from.
+Gender = Literal['male', 'female']
+Activity = Literal[tuple(level.name.lower() for level in ActivityLevel)]
+GoalName = Literal[tuple(goal.name.lower() for goal in Goal)]
+WeightUnit = Literal['kg', 'lbs']
+HeightUnit = Literal['cm']
+
+class CalculateRequest(msgspec.Struct):
+    """Body of /api/calculate."""
+    age: Age
+    gender: Gender
+    weight: Weight
+    height: Height
+    activity: Activity
+    goal: GoalName
+    weight_unit: WeightUnit = 'kg'
+    height_unit: HeightUnit = 'cm'
+
+class MacroRatios(msgspec.Struct):
+    """Share of daily calories per macronutrient."""
+    protein: Ratio = 0.30
+    carbs: Ratio = 0.40
+    fats: Ratio = 0.30
+
+class MacrosRequest(msgspec.Struct):
+    """Body of /api/macros."""
+    calories: Calories
+    ratios: MacroRatios = msgspec.field(default_factory=MacroRatios)
+
+class MealPlanRequest(msgspec.Struct):
+    """Body of /api/meal-plan."""
+    calories: Calories
+    meals: int = 4
+
+# Decode and validate request bodies in a single pass
+_calculate_decoder = msgspec.json.Decoder(CalculateRequest)
+_macros_decoder = msgspec.json.Decoder(MacrosRequest)
+_meal_plan_decoder = msgspec.json.Decoder(MealPlanRequest)
+
+@lru_cache(maxsize=4096, typed=True)
+def _encoded_result(age, gender, weight, height, activity_level, goal,
+                    weight_unit, height_unit):
+    """
+    Memoized calculate_all result, pre-encoded as JSON. Caching immutable
+    bytes lets repeated submissions skip both the calculation and its
+    serialization without sharing a mutable result between requests.
+    """
+    result = calculator.calculate_all(age, gender, weight, height, activity_level,
+                                      goal, weight_unit, height_unit)
+    return orjson.dumps(result, option=_JSON_OPTIONS)
+
+async def calculate(request):
     """Calculate calories based on user input."""
     try:
-        data = request.json
+        data = _calculate_decoder.decode(await request.body())
         
-        result = calculator.calculate_all(
-            age=data['age'],
-            gender=data['gender'],
-            weight=data['weight'],
-            height=data['height'],
-            activity_level=data['activity'],
-            goal=data['goal'],
-            weight_unit=data.get('weight_unit', 'kg'),
-            height_unit=data.get('height_unit', 'cm')
+        result = _encoded_result(
+            data.age,
+            data.gender,
+            data.weight,
+            data.height,
+            data.activity,
+            data.goal,
+            data.weight_unit,
+            data.height_unit
         )
         
-        return jsonify({
+        return orjson_response({
             'success': True,
-            'data': result,
-            'timestamp': datetime.now().isoformat()
+            'data': orjson.Fragment(result),
+            'timestamp': time_ns() // 1_000_000
         })
         
     except Exception as e:
-        return jsonify({
+        return orjson_response({
             'success': False,
             'error': str(e)
-        }), 400
+        }, status=400)
 
-@app.route('/api/macros', methods=['POST'])
-def custom_macros():
+async def custom_macros(request):
     """Calculate custom macro distribution."""
     try:
-        data = request.json
-        calories = data['calories']
-        ratios = data.get('ratios', {'protein': 0.30, 'carbs': 0.40, 'fats': 0.30})
+        data = _macros_decoder.decode(await request.body())
         
-        macros = calculator.calculate_macros(calories, ratios)
+        ratios = data.ratios
+        macros = calculator.calculate_macros(data.calories, {
+            'protein': ratios.protein,
+            'carbs': ratios.carbs,
+            'fats': ratios.fats
+        })
         
-        return jsonify({
+        return orjson_response({
             'success': True,
             'data': macros
         })
         
     except Exception as e:
-        return jsonify({
+        return orjson_response({
             'success': False,
             'error': str(e)
-        }), 400
+        }, status=400)
 
-@app.route('/api/meal-plan', methods=['POST'])
-def meal_plan():
+async def meal_plan(request):
     """Generate a meal plan based on calorie target."""
     try:
-        data = request.json
-        calories = data['calories']
-        meals = data.get('meals', 4)
+        data = _meal_plan_decoder.decode(await request.body())
         
-        plan = calculator.generate_meal_plan(calories, meals)
+        plan = calculator.generate_meal_plan(data.calories, data.meals)
         
-        return jsonify({
+        return orjson_response({
             'success': True,
             'data': plan
         })
         
     except Exception as e:
-        return jsonify({
+        return orjson_response({
             'success': False,
             'error': str(e)
-        }), 400
+        }, status=400)
+
+api = Starlette(
+    routes=[
+        Route('/api/calculate', calculate, methods=['POST']),
+        Route('/api/macros', custom_macros, methods=['POST']),
+        Route('/api/meal-plan', meal_plan, methods=['POST'])
+    ],
+    middleware=[
+        # Fixed CORS policy: any origin may call the JSON API
+        Middleware(CORSMiddleware, allow_origins=['*'],
+                   allow_methods=['GET', 'POST', 'OPTIONS'],
+                   allow_headers=['Content-Type']),
+        Middleware(GZipMiddleware, minimum_size=200)
+    ]
+)
 
-@app.route('/api/health', methods=['GET'])
-def health_check():
-    """Health check endpoint."""
-    return jsonify({'status': 'healthy', 'version': '1.0.0'})
+async def health_check(scope, receive, send):
+    """
+    Health check endpoint as a raw ASGI app, dispatched ahead of the
+    Starlette app so probes skip routing and middleware.
+    """
+    if scope['method'] in ('GET', 'HEAD'):
+        response = Response(_HEALTH_BODY, media_type='application/json')
+    else:
+        response = Response(status_code=405, headers={'Allow': 'GET, HEAD'})
+    await response(scope, receive, send)
+
+async def app(scope, receive, send):
+    """ASGI entry point."""
+    if scope['type'] == 'http' and scope['path'].rstrip('/') == '/api/health':
+        await health_check(scope, receive, send)
+    else:
+        await api(scope, receive, send)
 
 import os
 
+# Development server only; production runs uvicorn workers (see Procfile)
 if __name__ == "__main__":
+    import uvicorn
     port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port, debug=False)
-
+    uvicorn.run(app, host="0.0.0.0", port=port)
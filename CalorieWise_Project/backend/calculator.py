@@ -1,6 +1,17 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Final, Optional, Tuple
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
+import numpy as np
+from _kernels import core_metrics
+
+# kcal per gram of protein, carbs and fats
+_MACRO_KCAL_PER_GRAM = np.array([4.0, 4.0, 9.0])
+
+# Lower bounds of each BMI category after the first
+_BMI_THRESHOLDS = (18.5, 25.0, 30.0)
+_BMI_CATEGORIES = ('Underweight', 'Normal', 'Overweight', 'Obese')
 
 class ActivityLevel(Enum):
     SEDENTARY = 1.2
@@ -16,10 +27,35 @@ class Goal(Enum):
     GAIN = 500
     GAIN_FAST = 1000
 
-@dataclass
+# The enums are the source of truth; API keys are the lowercased names
+_ACTIVITY_MULTIPLIERS: Final[Dict[str, float]] = {
+    level.name.lower(): level.value for level in ActivityLevel
+}
+_GOAL_ADJUSTMENTS: Final[Dict[str, int]] = {
+    goal.name.lower(): goal.value for goal in Goal
+}
+
+# (activity, goal) -> (multiplier, adjustment), one probe per request
+_COMBOS: Final[Dict[Tuple[str, str], Tuple[float, int]]] = {
+    (activity, goal): (multiplier, adjustment)
+    for activity, multiplier in _ACTIVITY_MULTIPLIERS.items()
+    for goal, adjustment in _GOAL_ADJUSTMENTS.items()
+}
+
+# Meal templates for generate_meal_plan_batch as (meal, share of daily
+# calories); keep in sync with generate_meal_plan. 4 is the default
+_MEAL_PLANS: Final[Dict[int, Tuple[Tuple[str, float], ...]]] = {
+    3: (('breakfast', 0.30), ('lunch', 0.40), ('dinner', 0.30)),
+    4: (('breakfast', 0.25), ('lunch', 0.35), ('dinner', 0.30),
+        ('snacks', 0.10)),
+    5: (('breakfast', 0.25), ('snack1', 0.10), ('lunch', 0.30),
+        ('snack2', 0.10), ('dinner', 0.25))
+}
+
+@dataclass(slots=True)
 class NutritionResult:
-    bmr: float
-    tdee: float
+    bmr: int
+    tdee: int
     daily_calories: int
     bmi: float
     bmi_category: str
@@ -27,6 +63,8 @@ class NutritionResult:
     meal_plan: Dict[str, int]
     weekly_deficit_surplus: int
     projected_weekly_change_kg: float
+    weight_kg: float
+    height_cm: float
 
 class CalorieCalculator:
     """
@@ -34,22 +72,9 @@ class CalorieCalculator:
     validated formulas for accurate nutrition planning.
     """
     
-    def __init__(self):
-        self.activity_multipliers = {
-            'sedentary': 1.2,
-            'light': 1.375,
-            'moderate': 1.55,
-            'active': 1.725,
-            'extra_active': 1.9
-        }
-        
-        self.goal_adjustments = {
-            'lose_fast': -1000,
-            'lose': -500,
-            'maintain': 0,
-            'gain': 500,
-            'gain_fast': 1000
-        }
+    # Read-only views of the module tables, kept for existing callers
+    activity_multipliers = MappingProxyType(_ACTIVITY_MULTIPLIERS)
+    goal_adjustments = MappingProxyType(_GOAL_ADJUSTMENTS)
     
     def convert_weight(self, weight: float, from_unit: str) -> float:
         """Convert weight to kg."""
@@ -61,9 +86,13 @@ class CalorieCalculator:
                        feet: int = 0, inches: int = 0) -> float:
         """Convert height to cm."""
         if from_unit == 'ft':
-            return (feet * 30.48) + (inches * 2.54)
+            return self.ft_in_to_cm(feet, inches)
         return height
     
+    def ft_in_to_cm(self, feet: int, inches: int) -> float:
+        """Convert a feet/inches height to cm."""
+        return (feet * 30.48) + (inches * 2.54)
+    
     def calculate_bmr_mifflin(self, weight_kg: float, height_cm: float, 
                                age: int, gender: str) -> float:
         """
@@ -78,9 +107,18 @@ class CalorieCalculator:
     
     def calculate_tdee(self, bmr: float, activity_level: str) -> float:
         """Calculate Total Daily Energy Expenditure."""
-        multiplier = self.activity_multipliers.get(activity_level, 1.2)
+        multiplier = _ACTIVITY_MULTIPLIERS.get(activity_level, 1.2)
         return bmr * multiplier
     
+    def _lookup_combo(self, activity_level: str, goal: str) -> Tuple[float, int]:
+        """Get the (multiplier, adjustment) pair for an activity/goal."""
+        combo = _COMBOS.get((activity_level, goal))
+        if combo is None:
+            # Unknown keys fall back independently, as the separate lookups did
+            combo = (_ACTIVITY_MULTIPLIERS.get(activity_level, 1.2),
+                     _GOAL_ADJUSTMENTS.get(goal, 0))
+        return combo
+    
     def calculate_bmi(self, weight_kg: float, height_cm: float) -> float:
         """Calculate Body Mass Index."""
         height_m = height_cm / 100
@@ -88,14 +126,7 @@ class CalorieCalculator:
     
     def get_bmi_category(self, bmi: float) -> str:
         """Get BMI category based on value."""
-        if bmi < 18.5:
-            return 'Underweight'
-        elif bmi < 25:
-            return 'Normal'
-        elif bmi < 30:
-            return 'Overweight'
-        else:
-            return 'Obese'
+        return _BMI_CATEGORIES[bisect_right(_BMI_THRESHOLDS, bmi)]
     
     def calculate_macros(self, calories: int, 
                         ratios: Optional[Dict[str, float]] = None) -> Dict[str, Dict[str, Any]]:
@@ -118,6 +149,23 @@ class CalorieCalculator:
             }
         }
     
+    def calculate_macros_batch(self, calories: np.ndarray,
+                               ratios: np.ndarray) -> np.ndarray:
+        """
+        Calculate macronutrient grams for many calorie targets at once.
+        
+        Args:
+            calories: Array of N daily calorie targets
+            ratios: (protein, carbs, fats) shares, either one row of 3
+                or an (N, 3) array with a row per target
+        
+        Returns:
+            (N, 3) int32 array of protein, carbs and fats grams
+        """
+        calories = np.asarray(calories, dtype=np.float64)
+        ratios = np.asarray(ratios, dtype=np.float64)
+        return np.rint(calories[:, None] * ratios / _MACRO_KCAL_PER_GRAM).astype(np.int32)
+    
     def generate_meal_plan(self, calories: int, meals: int = 4) -> Dict[str, int]:
         """Generate a basic meal plan distribution."""
         if meals == 3:
@@ -142,6 +190,18 @@ class CalorieCalculator:
                 'snacks': round(calories * 0.10)
             }
     
+    def generate_meal_plan_batch(self, calories: np.ndarray, meals: int = 4) -> np.ndarray:
+        """
+        Generate meal plans for many calorie targets at once.
+        
+        Returns an (N, meals) int32 array whose columns follow the key
+        order of the dict returned by generate_meal_plan.
+        """
+        template = _MEAL_PLANS.get(meals, _MEAL_PLANS[4])
+        ratios = np.array([ratio for _, ratio in template])
+        calories = np.asarray(calories, dtype=np.float64)
+        return np.rint(calories[:, None] * ratios).astype(np.int32)
+    
     def calculate_weekly_change(self, daily_deficit_surplus: int) -> float:
         """Calculate projected weekly weight change in kg."""
         # 1 kg = 7700 calories
@@ -149,7 +209,7 @@ class CalorieCalculator:
     
     def calculate_all(self, age: int, gender: str, weight: float, height: float,
                      activity_level: str, goal: str, 
-                     weight_unit: str = 'kg', height_unit: str = 'cm') -> Dict[str, Any]:
+                     weight_unit: str = 'kg', height_unit: str = 'cm') -> NutritionResult:
         """
         Calculate all nutrition metrics at once.
         
@@ -164,22 +224,19 @@ class CalorieCalculator:
             height_unit: 'cm' or 'ft'
         
         Returns:
-            Dictionary containing all calculated metrics
+            NutritionResult containing all calculated metrics
         """
         # Convert units
         weight_kg = self.convert_weight(weight, weight_unit)
         height_cm = self.convert_height(height, height_unit)
         
         # Calculate basic metrics
-        bmr = self.calculate_bmr_mifflin(weight_kg, height_cm, age, gender)
-        tdee = self.calculate_tdee(bmr, activity_level)
-        bmi = self.calculate_bmi(weight_kg, height_cm)
+        multiplier, goal_adjustment = self._lookup_combo(activity_level, goal)
+        bmr, tdee, daily_calories, bmi = core_metrics(
+            float(weight_kg), float(height_cm), float(age),
+            gender.lower() == 'male', multiplier, float(goal_adjustment))
         bmi_category = self.get_bmi_category(bmi)
         
-        # Apply goal adjustment
-        goal_adjustment = self.goal_adjustments.get(goal, 0)
-        daily_calories = round(tdee + goal_adjustment)
-        
         # Calculate macros
         macros = self.calculate_macros(daily_calories)
         
@@ -189,16 +246,16 @@ class CalorieCalculator:
         # Calculate weekly projections
         weekly_change = self.calculate_weekly_change(goal_adjustment)
         
-        return {
-            'bmr': round(bmr),
-            'tdee': round(tdee),
-            'daily_calories': daily_calories,
-            'bmi': round(bmi, 1),
-            'bmi_category': bmi_category,
-            'macros': macros,
-            'meal_plan': meal_plan,
-            'weekly_deficit_surplus': goal_adjustment,
-            'projected_weekly_change_kg': round(weekly_change, 2),
-            'weight_kg': round(weight_kg, 1),
-            'height_cm': round(height_cm, 1)
-        }
+        return NutritionResult(
+            bmr=bmr,
+            tdee=tdee,
+            daily_calories=daily_calories,
+            bmi=round(bmi, 1),
+            bmi_category=bmi_category,
+            macros=macros,
+            meal_plan=meal_plan,
+            weekly_deficit_surplus=goal_adjustment,
+            projected_weekly_change_kg=round(weekly_change, 2),
+            weight_kg=round(weight_kg, 1),
+            height_cm=round(height_cm, 1)
+        )
@@ -0,0 +1,121 @@
+from starlette.testclient import TestClient
+from app import app
+
+client = TestClient(app)
+
+PAYLOAD = {
+    'age': 30,
+    'gender': 'male',
+    'weight': 80,
+    'height': 180,
+    'activity': 'moderate',
+    'goal': 'lose'
+}
+
+def test_calculate():
+    response = client.post('/api/calculate', json=PAYLOAD)
+    assert response.status_code == 200
+    body = response.json()
+    assert body['success'] is True
+    assert isinstance(body['timestamp'], int)
+    data = body['data']
+    assert data['bmr'] == 1780
+    assert data['tdee'] == 2759
+    assert data['daily_calories'] == 2259
+    assert data['bmi'] == 24.7
+    assert data['bmi_category'] == 'Normal'
+    assert data['macros']['protein'] == {'grams': 169, 'percent': 30}
+    assert data['meal_plan'] == {'breakfast': 565, 'lunch': 791,
+                                 'dinner': 678, 'snacks': 226}
+
+def test_calculate_repeated_request_is_stable():
+    first = client.post('/api/calculate', json=PAYLOAD).json()['data']
+    second = client.post('/api/calculate', json=PAYLOAD).json()['data']
+    assert first == second
+
+def test_calculate_rejects_invalid_input():
+    invalid = [
+        {k: v for k, v in PAYLOAD.items() if k != 'age'},
+        {**PAYLOAD, 'activity': 'moderat'},
+        {**PAYLOAD, 'weight_unit': 'lb'},
+        {**PAYLOAD, 'height_unit': 'ft'},
+        {**PAYLOAD, 'weight': 1e308},
+        {**PAYLOAD, 'age': 0}
+    ]
+    for payload in invalid:
+        response = client.post('/api/calculate', json=payload)
+        assert response.status_code == 400
+        body = response.json()
+        assert body['success'] is False
+        assert body['error']
+
+def test_calculate_rejects_malformed_json():
+    response = client.post('/api/calculate', content=b'{not json',
+                           headers={'Content-Type': 'application/json'})
+    assert response.status_code == 400
+    assert response.json()['success'] is False
+
+def test_macros():
+    response = client.post('/api/macros', json={'calories': 2000})
+    assert response.status_code == 200
+    assert response.json()['data'] == {
+        'protein': {'grams': 150, 'percent': 30},
+        'carbs': {'grams': 200, 'percent': 40},
+        'fats': {'grams': 67, 'percent': 30}
+    }
+
+def test_macros_partial_ratios_use_defaults():
+    response = client.post('/api/macros',
+                           json={'calories': 2000, 'ratios': {'protein': 0.5}})
+    assert response.status_code == 200
+    data = response.json()['data']
+    assert data['protein'] == {'grams': 250, 'percent': 50}
+    assert data['carbs'] == {'grams': 200, 'percent': 40}
+
+def test_meal_plan():
+    response = client.post('/api/meal-plan', json={'calories': 2000, 'meals': 3})
+    assert response.status_code == 200
+    assert response.json()['data'] == {'breakfast': 600, 'lunch': 800, 'dinner': 600}
+
+def test_meal_plan_rejects_negative_calories():
+    response = client.post('/api/meal-plan', json={'calories': -1})
+    assert response.status_code == 400
+    assert response.json()['success'] is False
+
+def test_health():
+    response = client.get('/api/health')
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/json'
+    assert response.json() == {'status': 'healthy', 'version': '1.0.0'}
+
+def test_health_head_and_405():
+    assert client.head('/api/health').status_code == 200
+    response = client.post('/api/health')
+    assert response.status_code == 405
+    assert response.headers['allow'] == 'GET, HEAD'
+
+def test_cors_preflight():
+    response = client.options('/api/calculate', headers={
+        'Origin': 'https://example.com',
+        'Access-Control-Request-Method': 'POST',
+        'Access-Control-Request-Headers': 'Content-Type'
+    })
+    assert response.status_code == 200
+    assert response.headers['access-control-allow-origin'] == '*'
+    assert 'POST' in response.headers['access-control-allow-methods']
+
+def test_cors_header_on_response():
+    response = client.post('/api/calculate', json=PAYLOAD,
+                           headers={'Origin': 'https://example.com'})
+    assert response.headers['access-control-allow-origin'] == '*'
+
+def test_gzip():
+    response = client.post('/api/calculate', json=PAYLOAD,
+                           headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.json()['success'] is True
+
+def test_small_responses_are_not_compressed():
+    response = client.post('/api/meal-plan', json={'calories': 2000},
+                           headers={'Accept-Encoding': 'gzip'})
+    assert 'content-encoding' not in response.headers